@@ -0,0 +1,12 @@
+#!/usr/bin/env python
+# coding=utf-8
+# Parse pffi.h once and emit _poker_ffi.py (cffi out-of-line ABI mode),
+# so testffi.py no longer re-parses the cdefs on every run.
+from cffi import FFI
+
+ffi = FFI()
+ffi.cdef(open('pffi.h').read())
+ffi.set_source("_poker_ffi", None)
+
+if __name__ == "__main__":
+    ffi.compile()
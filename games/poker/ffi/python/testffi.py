@@ -1,6 +1,6 @@
 #!/usr/bin/env python
 # coding=utf-8
-from cffi import FFI
+from _poker_ffi import ffi
 from inspect import getmembers
 from pprint import pprint
 import json
@@ -17,10 +17,10 @@ import json
 #     else:
 #         return cd
 
-ffi = FFI()
-ffi.cdef(open('pffi.h').read())
 print("Open poker_ffi dylib...")
 lib = ffi.dlopen("../target/release/libpoker_ffi.dylib")
+# output buffer allocated once and reused across calls
+out = ffi.new("uint8_t [64]")
 
 npc = lib.rs_PokerCards_new()
 
@@ -54,7 +54,6 @@ lib.rs_TexasCardBuffer_free(bs)
 lib.rs_TexasCards_free(tps)
 
 gcs = lib.rs_GinRummyCards_new()
-out = ffi.new("uint8_t [64]")
 lib.rs_GinRummyCards_assign(gcs, ffi.new("uint16_t []", [1,45, 2,3,4,5,31,32,33,40]), 10, 1, out)
 print("ooooooooooooo", out[0], out[1])
 lib.rs_GinRummyCards_free(gcs)
@@ -16,4 +16,6 @@ int8_t rs_TemplateData_shuffle(rs_TemplateData *p_pcs);
 
 int8_t rs_TemplateData_next(rs_TemplateData *p_pcs, uint8_t *p_out);
 
+int8_t rs_TemplateData_next_bulk(rs_TemplateData *p_pcs, uint8_t *p_out, uintptr_t n);
+
 } // extern "C"
@@ -7,6 +7,9 @@ void test_template() {
     rs_TemplateData_shuffle(td);
     rs_TemplateData_next(td, out);
     printf("out...%d\n", out[0]);
+    unsigned char bulk[16];
+    rs_TemplateData_next_bulk(td, bulk, 16);
+    printf("bulk...%d %d\n", bulk[0], bulk[15]);
     rs_TemplateData_free(td);
 }
 
@@ -7,3 +7,5 @@ void rs_TemplateData_free(struct rs_TemplateData *p_pcs);
 int8_t rs_TemplateData_shuffle(struct rs_TemplateData *p_pcs);
 
 int8_t rs_TemplateData_next(struct rs_TemplateData *p_pcs, uint8_t *p_out);
+
+int8_t rs_TemplateData_next_bulk(struct rs_TemplateData *p_pcs, uint8_t *p_out, uintptr_t n);
@@ -1,20 +1,25 @@
 #!/usr/bin/env python
 # coding=utf-8
-from cffi import FFI
+from _template_ffi import ffi
 from inspect import getmembers
 from pprint import pprint
 import json
 
-ffi = FFI()
-ffi.cdef(open('pffi.h').read())
 print("Open template_ffi dylib...")
 lib = ffi.dlopen("../target/release/libtemplate_ffi.dylib")
+# output buffer allocated once and reused by every rs_*_next call
+out = ffi.new("uint8_t [1]")
+BULK_N = 1024
+bulk = ffi.new("uint8_t [%d]" % BULK_N)
 
 npc = lib.rs_TemplateData_new()
 print(npc)
 lib.rs_TemplateData_shuffle(npc)
-out = ffi.new("uint8_t []", [0])
+out[0] = 0
 print(lib.rs_TemplateData_next(npc, out))
 print(out[0])
+# fetch BULK_N values in one ffi call
+print(lib.rs_TemplateData_next_bulk(npc, bulk, BULK_N))
+print(bytes(ffi.buffer(bulk, 16)))
 
 lib.rs_TemplateData_free(npc)
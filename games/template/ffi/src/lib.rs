@@ -41,3 +41,22 @@ pub extern "C" fn rs_TemplateData_next(p_pcs: *mut TemplateData, p_out: *mut u8)
     std::mem::forget(ps);
     return 0;
 }
+
+#[no_mangle]
+pub extern "C" fn rs_TemplateData_next_bulk(
+    p_pcs: *mut TemplateData,
+    p_out: *mut u8,
+    n: usize,
+) -> i8 {
+    if p_pcs.is_null() || p_out.is_null() {
+        return -1;
+    }
+
+    let mut ps = unsafe { Box::from_raw(p_pcs) };
+    let outs = unsafe { std::slice::from_raw_parts_mut(p_out, n) };
+    for o in outs.iter_mut() {
+        *o = ps.next();
+    }
+    std::mem::forget(ps);
+    return 0;
+}